@@ -0,0 +1,137 @@
+"""Compare plaintext and encrypted download throughput on loopback.
+
+Starts a headless sender on 127.0.0.1, once in plaintext and once with TLS
+using a throwaway CA, downloads the same file through the receiver code and
+reports MB/s for each mode. The ratio compares the path an encrypted
+single-source download takes by default (one stream, or the mirror path with
+TLS_STREAMS streams on machines with spare cores) against the plaintext
+single-stream download. Needs openssl on PATH for the certificates.
+
+    python benchmarks/bench_transfer.py --size 200 --repeat 3
+
+With --min-ratio the script exits non-zero when the default encrypted mode is
+slower than that fraction of plaintext.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+from loopback import Sender, make_certificates, make_receiver, receiver, start_sender, tls_contexts  # noqa: E402
+
+FILENAME = "payload.bin"
+
+# Shared across runs, as one client keeps its sessions between downloads
+tls_sessions = {}
+
+
+def single_stream(source, output_dir, ssl_context):
+    """The original one-connection download path"""
+    app = make_receiver(output_dir, [source], ssl_context)
+    app.update_file_list = lambda count: None
+    app.update_ui_connected = lambda: None
+    app.connect_thread([source])
+    app.download_thread(FILENAME)
+    app.socket.close()
+    return app
+
+
+def mirror_download(source, output_dir, ssl_context):
+    """The mirror download path, with TLS_STREAMS connections when encrypted"""
+    app = make_receiver(output_dir, [source], ssl_context)
+    app.tls_sessions = tls_sessions
+    app.resumed = 0
+    open_mirror = app.open_mirror
+
+    def counting_open_mirror(mirror):
+        sock = open_mirror(mirror)
+        app.resumed += bool(getattr(sock, "session_reused", False))
+        return sock
+
+    app.open_mirror = counting_open_mirror
+    app.swarm_download_thread(FILENAME)
+    return app
+
+
+def measure(name, download, source, output_dir, ssl_context, expected, repeat):
+    best = None
+    for _ in range(repeat):
+        output = os.path.join(output_dir, FILENAME)
+        if os.path.exists(output):
+            os.remove(output)
+
+        start = time.perf_counter()
+        app = download(source, output_dir, ssl_context)
+        elapsed = time.perf_counter() - start
+
+        with open(output, "rb") as f:
+            if f.read() != expected:
+                raise SystemExit(f"{name}: downloaded file does not match")
+        best = elapsed if best is None else min(best, elapsed)
+
+    rate = len(expected) / best / (1024 * 1024)
+    note = f"  ({app.resumed} resumed sessions)" if hasattr(app, "resumed") and ssl_context else ""
+    print(f"{name:<34} {best:7.3f} s  {rate:8.1f} MB/s{note}")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200, help="file size in MB (default 200)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode, best is kept (default 3)")
+    parser.add_argument("--min-ratio", type=float, help="fail if encrypted/plaintext is below this")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        share = os.path.join(tmp, "share")
+        output_dir = os.path.join(tmp, "out")
+        os.mkdir(share)
+        os.mkdir(output_dir)
+
+        expected = os.urandom(args.size * 1024 * 1024)
+        with open(os.path.join(share, FILENAME), "wb") as f:
+            f.write(expected)
+
+        paths = make_certificates(tmp)
+        if paths is None:
+            raise SystemExit("openssl is needed to create the test certificates")
+        server_context, client_context = tls_contexts(*paths)
+
+        plain_app, plain_port, stop_plain = start_sender(share)
+        tls_app, tls_port, stop_tls = start_sender(share, Sender(ssl_context=server_context))
+        plain = ("127.0.0.1", plain_port)
+        encrypted = ("127.0.0.1", tls_port)
+
+        # Senders hash on the first request; get that done before timing anything
+        path = os.path.join(share, FILENAME)
+        while not (plain_app.file_hashes(path) and tls_app.file_hashes(path)):
+            time.sleep(0.1)
+
+        print(f"{args.size} MB on loopback, {os.cpu_count()} CPUs, best of {args.repeat}")
+        baseline = measure("plaintext, single stream", single_stream, plain, output_dir, None,
+                           expected, args.repeat)
+        measure("plaintext, mirror download", mirror_download, plain, output_dir, None, expected, args.repeat)
+        rate = measure("TLS, single stream", single_stream, encrypted, output_dir, client_context,
+                       expected, args.repeat)
+
+        # The default stream count follows the CPU count, and with more than one
+        # stream encrypted downloads take the mirror path instead
+        streams = receiver.TLS_STREAMS
+        if streams > 1:
+            rate = measure(f"TLS, mirror download, {streams} streams", mirror_download, encrypted, output_dir,
+                           client_context, expected, args.repeat)
+
+        stop_plain()
+        stop_tls()
+
+    ratio = rate / baseline
+    print(f"encrypted / plaintext: {ratio:.2f}")
+    if args.min_ratio is not None and ratio < args.min_ratio:
+        raise SystemExit(f"encrypted throughput is below {args.min_ratio:.2f} of plaintext")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,23 @@ import os
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 import threading
+import hashlib
+import ssl
+import time
+from collections import Counter
 
 # Default configuration
 SEPARATOR = "<SEPARATOR>"
 BUFFER_SIZE = 4096
+TRANSFER_BUFFER_SIZE = 256 * 1024  # Socket reads for file data
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 5001
+MIRROR_MARKER = f"{SEPARATOR}MIRROR{SEPARATOR}"  # Ends the file list in mirror mode
+HASH_WAIT_TIMEOUT = 600  # Seconds to wait for a mirror to finish hashing a file
+HASH_POLL_INTERVAL = 0.5  # Seconds between INFO requests while a mirror is hashing
+SWARM_MAX_FAILURES = 3  # Consecutive errors before a mirror is dropped
+SWARM_MAX_DUPLICATES = 2  # Mirrors allowed to race for the same chunk at the end
+TLS_STREAMS = min(4, os.cpu_count() or 1)  # Parallel TLS connections per mirror, one per core
 
 class FileReceiverApp:
     def __init__(self, root):
@@ -21,6 +32,9 @@ class FileReceiverApp:
         self.connected = False
         self.socket = None
         self.available_files = []
+        self.sources = []
+        self.ssl_context = None
+        self.tls_sessions = {}  # (host, port) -> ssl.SSLSession for resumption
         
         # Create main container
         main_frame = tk.Frame(root, bg="#f0f0f0")
@@ -30,10 +44,10 @@ class FileReceiverApp:
         settings_frame = tk.LabelFrame(main_frame, text="Connection Settings", bg="#f0f0f0", padx=10, pady=10)
         settings_frame.pack(fill=tk.X, pady=10)
         
-        # Host input
+        # Host input (a comma-separated list of host or host:port mirrors is accepted)
         tk.Label(settings_frame, text="Server Host:", bg="#f0f0f0").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         self.host_var = tk.StringVar(value=DEFAULT_HOST)
-        self.host_entry = tk.Entry(settings_frame, textvariable=self.host_var, width=15)
+        self.host_entry = tk.Entry(settings_frame, textvariable=self.host_var, width=30)
         self.host_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
         
         # Port input
@@ -51,6 +65,19 @@ class FileReceiverApp:
         browse_btn = tk.Button(settings_frame, text="Browse", command=self.browse_directory)
         browse_btn.grid(row=1, column=4, padx=5, pady=5)
         
+        # TLS settings (leave the CA empty to use the system certificates)
+        tk.Label(settings_frame, text="CA Certificate:", bg="#f0f0f0").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        self.ca_var = tk.StringVar(value="")
+        self.ca_entry = tk.Entry(settings_frame, textvariable=self.ca_var, width=40)
+        self.ca_entry.grid(row=2, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W+tk.E)
+        
+        ca_btn = tk.Button(settings_frame, text="Browse", command=self.browse_ca)
+        ca_btn.grid(row=2, column=4, padx=5, pady=5)
+        
+        self.tls_var = tk.BooleanVar(value=False)
+        self.tls_check = tk.Checkbutton(settings_frame, text="Encrypt connection (TLS)", variable=self.tls_var, bg="#f0f0f0")
+        self.tls_check.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky=tk.W)
+        
         # Connect button
         self.connect_btn = tk.Button(settings_frame, text="Connect to Server", command=self.toggle_connection,
                                    bg="#4CAF50", fg="white", width=15, height=2)
@@ -127,6 +154,12 @@ class FileReceiverApp:
             if not os.path.exists(directory):
                 os.makedirs(directory)
     
+    def browse_ca(self):
+        """Browse for the CA certificate used to verify the server"""
+        filename = filedialog.askopenfilename(filetypes=[("PEM files", "*.pem *.crt"), ("All files", "*.*")])
+        if filename:
+            self.ca_var.set(filename)
+    
     def toggle_connection(self):
         """Connect to or disconnect from the server"""
         if self.connected:
@@ -134,73 +167,165 @@ class FileReceiverApp:
         else:
             self.connect_to_server()
     
+    def parse_sources(self, hosts, default_port):
+        """Parse a comma-separated list of host or host:port entries"""
+        sources = []
+        for entry in hosts.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            if ":" in entry:
+                host, port = entry.rsplit(":", 1)
+                sources.append((host.strip(), int(port)))
+            else:
+                sources.append((entry, default_port))
+        return sources
+    
     def connect_to_server(self):
         """Connect to the file transfer server"""
         try:
-            host = self.host_var.get()
-            port = int(self.port_var.get())
+            self.sources = self.parse_sources(self.host_var.get(), int(self.port_var.get()))
+            if not self.sources:
+                self.log("Error: No server host given!")
+                self.update_status("Error: No server host")
+                return
+            
+            # Saved sessions only resume with the context that created them
+            if self.tls_var.get():
+                self.ssl_context = ssl.create_default_context(cafile=self.ca_var.get().strip() or None)
+            else:
+                self.ssl_context = None
+            self.tls_sessions = {}
             
             # Disable the connection fields
             self.host_entry.config(state=tk.DISABLED)
             self.port_entry.config(state=tk.DISABLED)
             self.output_dir_entry.config(state=tk.DISABLED)
+            self.ca_entry.config(state=tk.DISABLED)
+            self.tls_check.config(state=tk.DISABLED)
             self.connect_btn.config(state=tk.DISABLED)
             
             # Start connection in a separate thread
-            threading.Thread(target=self.connect_thread, args=(host, port), daemon=True).start()
+            threading.Thread(target=self.connect_thread, args=(self.sources,), daemon=True).start()
             
         except ValueError:
             self.log("Error: Port must be a number!")
             self.update_status("Error: Invalid port number")
+        except (ssl.SSLError, OSError) as e:
+            self.log(f"Error loading CA certificate: {str(e)}")
+            self.update_status("Error: Invalid CA certificate")
     
-    def connect_thread(self, host, port):
-        """Handle server connection in a separate thread"""
+    def open_socket(self, host, port):
+        """Connect to a server, over TLS when enabled.
+        
+        A session saved from an earlier connection to the same server is
+        offered so reconnects can skip the full handshake.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(10)  # 10 second timeout
         try:
-            self.log(f"Connecting to {host}:{port}...")
-            self.update_status(f"Connecting to {host}:{port}...")
-            
-            # Create socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10)  # 10 second timeout
-            
-            # Connect to the server
-            self.socket.connect((host, port))
-            
-            self.log(f"Connected to server at {host}:{port}")
-            self.update_status("Connected. Receiving file list...")
+            if self.ssl_context:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=host,
+                                                    session=self.tls_sessions.get((host, port)))
+            sock.connect((host, port))
+        except:
+            sock.close()
+            raise
+        return sock
+    
+    def save_tls_session(self, sock, host, port):
+        """Keep the TLS session of a socket for resuming later connections"""
+        # TLS 1.3 tickets arrive after the handshake, so call this after a read
+        if isinstance(sock, ssl.SSLSocket) and sock.session:
+            self.tls_sessions[(host, port)] = sock.session
+    
+    def open_mirror(self, source):
+        """Open a persistent mirror connection to a source.
+        
+        The server sends its file list before reading any request, so the
+        list is skipped by reading up to the marker that acknowledges mirror
+        mode, however long the list is.
+        """
+        host, port = source
+        sock = self.open_socket(host, port)
+        try:
+            sock.send("MIRROR".encode())
             
-            # Receive file list
-            received = self.socket.recv(BUFFER_SIZE).decode()
-            count_str, files_str = received.split(SEPARATOR)
+            marker = MIRROR_MARKER.encode()
+            received = b""
+            while marker not in received:
+                bytes_read = sock.recv(BUFFER_SIZE)
+                if not bytes_read:
+                    raise ConnectionError("Source does not support mirror downloads")
+                received = received[-len(marker):] + bytes_read
             
-            if files_str:
-                self.available_files = files_str.split(";")
-                count = int(count_str)
+            self.save_tls_session(sock, host, port)
+        except:
+            sock.close()
+            raise
+        return sock
+    
+    def connect_thread(self, sources):
+        """Handle server connection in a separate thread.
+        
+        The file list comes from the first source that answers, so one
+        mirror being down does not stop the client from connecting.
+        """
+        for host, port in sources:
+            try:
+                self.log(f"Connecting to {host}:{port}...")
+                self.update_status(f"Connecting to {host}:{port}...")
                 
-                # Update the UI on the main thread
-                self.root.after(0, self.update_file_list, count)
-            else:
-                self.log("No files available on the server")
-                self.update_status("No files available")
-                self.root.after(0, self.disconnect_from_server)
+                # Connect to the server
+                self.socket = self.open_socket(host, port)
+                
+                self.log(f"Connected to server at {host}:{port}")
+                if isinstance(self.socket, ssl.SSLSocket):
+                    self.log(f"Encrypted with {self.socket.version()} ({self.socket.cipher()[0]})")
+                self.update_status("Connected. Receiving file list...")
+                
+                # Receive file list
+                received = self.socket.recv(BUFFER_SIZE).decode()
+                self.save_tls_session(self.socket, host, port)
+                count_str, files_str = received.split(SEPARATOR)
+                
+                if files_str:
+                    self.available_files = files_str.split(";")
+                    count = int(count_str)
+                    
+                    # Update the UI on the main thread
+                    self.root.after(0, self.update_file_list, count)
+                else:
+                    self.log("No files available on the server")
+                    self.update_status("No files available")
+                    self.root.after(0, self.disconnect_from_server)
+                    return
+                
+                # Update UI
+                self.connected = True
+                self.root.after(0, self.update_ui_connected)
                 return
+                
+            except ConnectionRefusedError:
+                self.log(f"Connection refused. Make sure the server is running at {host}:{port}")
+                self.update_status("Connection refused")
+            except socket.timeout:
+                self.log(f"Connection timed out. Server at {host}:{port} not responding")
+                self.update_status("Connection timed out")
+            except Exception as e:
+                self.log(f"Error connecting: {str(e)}")
+                self.update_status(f"Connection error: {str(e)}")
             
-            # Update UI
-            self.connected = True
-            self.root.after(0, self.update_ui_connected)
-            
-        except ConnectionRefusedError:
-            self.log(f"Connection refused. Make sure the server is running at {host}:{port}")
-            self.update_status("Connection refused")
-            self.root.after(0, self.reset_connection_ui)
-        except socket.timeout:
-            self.log(f"Connection timed out. Server at {host}:{port} not responding")
-            self.update_status("Connection timed out")
-            self.root.after(0, self.reset_connection_ui)
-        except Exception as e:
-            self.log(f"Error connecting: {str(e)}")
-            self.update_status(f"Connection error: {str(e)}")
-            self.root.after(0, self.reset_connection_ui)
+            # Try the next source
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+                self.socket = None
+        
+        self.root.after(0, self.reset_connection_ui)
     
     def update_file_list(self, count):
         """Update the file list in the UI"""
@@ -222,6 +347,8 @@ class FileReceiverApp:
         self.host_entry.config(state=tk.NORMAL)
         self.port_entry.config(state=tk.NORMAL)
         self.output_dir_entry.config(state=tk.NORMAL)
+        self.ca_entry.config(state=tk.NORMAL)
+        self.tls_check.config(state=tk.NORMAL)
         self.connect_btn.config(text="Connect to Server", bg="#4CAF50", state=tk.NORMAL)
         self.download_btn.config(state=tk.DISABLED)
         
@@ -274,8 +401,12 @@ class FileReceiverApp:
             
         filename = self.available_files[selected_idx[0]]
         
-        # Start download in a separate thread
-        threading.Thread(target=self.download_thread, args=(filename,), daemon=True).start()
+        # Start download in a separate thread. Encrypted downloads go through
+        # the swarm only when there are spare cores for several streams.
+        if len(self.sources) > 1 or (self.ssl_context and TLS_STREAMS > 1):
+            threading.Thread(target=self.swarm_download_thread, args=(filename,), daemon=True).start()
+        else:
+            threading.Thread(target=self.download_thread, args=(filename,), daemon=True).start()
     
     def download_thread(self, filename):
         """Handle file download in a separate thread"""
@@ -319,7 +450,7 @@ class FileReceiverApp:
             with open(output_path, "wb") as f:
                 while received_size < filesize:
                     # Read bytes from the socket
-                    bytes_read = self.socket.recv(BUFFER_SIZE)
+                    bytes_read = self.socket.recv(TRANSFER_BUFFER_SIZE)
                     
                     if not bytes_read:
                         # Connection closed prematurely
@@ -349,6 +480,301 @@ class FileReceiverApp:
             # Attempt to reconnect or at least reset UI
             self.root.after(0, self.reset_connection_ui)
     
+    def recv_exact(self, sock, length, cancelled=None):
+        """Receive exactly length bytes, or None if cancelled() becomes true first"""
+        data = bytearray(length)
+        view = memoryview(data)
+        received_size = 0
+        while received_size < length:
+            if cancelled and cancelled():
+                return None
+            
+            bytes_read = sock.recv_into(view[received_size:], min(TRANSFER_BUFFER_SIZE, length - received_size))
+            if not bytes_read:
+                raise ConnectionError(f"Connection closed after {received_size} of {length} bytes")
+            received_size += bytes_read
+        return data
+    
+    def request_block(self, sock, request, expected_size=None, cancelled=None):
+        """Send a mirror request and receive the block of data it answers with"""
+        sock.send(request.encode())
+        received = sock.recv(BUFFER_SIZE).decode()
+        
+        if not received:
+            raise ConnectionError("Source closed the connection")
+        if received.startswith("ERROR") or received.startswith("PENDING"):
+            _, error_msg = received.split(SEPARATOR)
+            raise IOError(error_msg)
+        
+        _, size = received.split(SEPARATOR)
+        size = int(size)
+        if expected_size is not None and size != expected_size:
+            raise IOError(f"Expected {expected_size} bytes, source offered {size}")
+        
+        sock.send("READY".encode())
+        return self.recv_exact(sock, size, cancelled)
+    
+    def fetch_file_info(self, sock, filename):
+        """Ask a mirror for the size, hash and chunk size of a file.
+        
+        Mirrors hash files in the background and answer PENDING until they
+        are done, so keep asking for up to HASH_WAIT_TIMEOUT seconds.
+        """
+        deadline = time.time() + HASH_WAIT_TIMEOUT
+        while True:
+            sock.send(f"INFO{SEPARATOR}{filename}".encode())
+            received = sock.recv(BUFFER_SIZE).decode()
+            
+            if not received:
+                raise ConnectionError("Source closed the connection")
+            if received.startswith("PENDING"):
+                if time.time() > deadline:
+                    raise TimeoutError("Source is still hashing the file")
+                time.sleep(HASH_POLL_INTERVAL)
+                continue
+            if received.startswith("ERROR"):
+                _, error_msg = received.split(SEPARATOR)
+                raise IOError(error_msg)
+            
+            _, filesize, file_hash, chunk_size = received.split(SEPARATOR)
+            return int(filesize), file_hash, int(chunk_size)
+    
+    def fetch_chunk_hashes(self, sock, filename, file_hash):
+        """Fetch the SHA-256 of every chunk, checked against the file hash"""
+        digests = self.request_block(sock, f"CHUNKS{SEPARATOR}{filename}")
+        if hashlib.sha256(digests).hexdigest() != file_hash:
+            raise IOError("Chunk hashes do not match the file hash")
+        return [bytes(digests[i:i + 32]) for i in range(0, len(digests), 32)]
+    
+    def fetch_range(self, sock, filename, offset, length, cancelled=None):
+        """Download part of a file over a mirror connection.
+        
+        Returns None if cancelled() becomes true before the range is complete,
+        leaving the connection unusable.
+        """
+        return self.request_block(sock, f"RANGE{SEPARATOR}{filename}{SEPARATOR}{offset}{SEPARATOR}{length}",
+                                  expected_size=length, cancelled=cancelled)
+    
+    def close_mirror(self, sock):
+        """Say goodbye to a mirror and close the connection"""
+        try:
+            sock.send("DISCONNECT".encode())
+        except:
+            pass
+        sock.close()
+    
+    def swarm_download_thread(self, filename):
+        """Download a file in chunks from several mirrors at once"""
+        mirrors = {}  # Source -> open mirror connection
+        try:
+            self.log(f"Checking {len(self.sources)} sources for: {filename}")
+            self.update_status(f"Checking sources for: {filename}")
+            
+            # Ask every mirror at once so a slow one doesn't hold up the rest
+            infos = {}
+            
+            def query(source):
+                try:
+                    mirrors[source] = self.open_mirror(source)
+                    infos[source] = self.fetch_file_info(mirrors[source], filename)
+                except Exception as e:
+                    self.log(f"Source {source[0]}:{source[1]} unavailable: {str(e)}")
+                    if source in mirrors:
+                        mirrors.pop(source).close()
+            
+            queries = [threading.Thread(target=query, args=(source,), daemon=True) for source in self.sources]
+            for thread in queries:
+                thread.start()
+            for thread in queries:
+                thread.join()
+            
+            if not infos:
+                self.log("Error: No source can provide the file")
+                self.root.after(0, self.update_status, "Error: No sources available")
+                return
+            
+            # Use the size and hash most sources agree on and skip the rest.
+            # On a tie, prefer the copy from the source listed first.
+            counts = Counter(infos.values())
+            top = max(counts.values())
+            filesize, file_hash, chunk_size = next(infos[source] for source in self.sources
+                                                   if source in infos and counts[infos[source]] == top)
+            sources = []
+            for source in self.sources:
+                if source not in infos:
+                    continue
+                if infos[source] == (filesize, file_hash, chunk_size):
+                    sources.append(source)
+                else:
+                    self.log(f"Source {source[0]}:{source[1]} has a different copy of {filename}, skipping")
+                    self.close_mirror(mirrors.pop(source))
+            
+            # Every chunk is checked on arrival, so one bad mirror can't spoil the file
+            digests = None
+            for source in sources:
+                try:
+                    digests = self.fetch_chunk_hashes(mirrors[source], filename, file_hash)
+                    break
+                except Exception as e:
+                    self.log(f"Chunk list from {source[0]}:{source[1]} rejected: {str(e)}")
+                    mirrors.pop(source).close()
+            
+            chunks = [(offset, min(chunk_size, filesize - offset))
+                      for offset in range(0, filesize, chunk_size)]
+            if digests is None or len(digests) != len(chunks):
+                self.log(f"Error: No source sent a valid chunk list for {filename}")
+                self.root.after(0, self.update_status, "Error: No valid chunk list")
+                return
+            
+            size_str = self.format_size(filesize)
+            self.log(f"Downloading {filename} ({size_str}) from {len(sources)} sources")
+            self.update_status(f"Downloading {filename}")
+            self.progress_var.set(0)
+            
+            output_path = os.path.join(self.output_dir_var.get(), filename)
+            with open(output_path, "wb") as f:
+                f.truncate(filesize)
+            
+            pending = list(range(len(chunks)))  # Chunks nobody is fetching
+            in_flight = {}  # Chunk index -> number of sources fetching it
+            fetching = {}  # Chunk index -> sockets it is being fetched over
+            done = set()
+            source_bytes = {source: 0 for source in sources}
+            received = [0]
+            cond = threading.Condition()
+            start_time = time.time()
+            
+            def next_chunk():
+                with cond:
+                    while len(done) < len(chunks):
+                        if pending:
+                            index = pending.pop(0)
+                        else:
+                            # Nothing left to hand out: race a slow source for one
+                            # of its chunks instead of sitting idle
+                            racing = [i for i, count in in_flight.items()
+                                      if i not in done and count < SWARM_MAX_DUPLICATES]
+                            if not racing:
+                                cond.wait(1.0)
+                                continue
+                            index = min(racing, key=lambda i: in_flight[i])
+                        in_flight[index] = in_flight.get(index, 0) + 1
+                        return index
+                    return None
+            
+            def release_chunk(index):
+                # Caller holds cond
+                in_flight[index] -= 1
+                if not in_flight[index]:
+                    del in_flight[index]
+                    if index not in done:
+                        pending.insert(0, index)
+                cond.notify_all()
+            
+            def worker(source, sock):
+                failures = 0
+                try:
+                    with open(output_path, "r+b") as f:
+                        while True:
+                            index = next_chunk()
+                            if index is None:
+                                return
+                            
+                            offset, length = chunks[index]
+                            try:
+                                if sock is None:
+                                    sock = self.open_mirror(source)
+                                with cond:
+                                    fetching.setdefault(index, set()).add(sock)
+                                try:
+                                    data = self.fetch_range(sock, filename, offset, length,
+                                                            cancelled=lambda: index in done)
+                                finally:
+                                    with cond:
+                                        fetching[index].discard(sock)
+                                if data is not None and hashlib.sha256(data).digest() != digests[index]:
+                                    raise IOError("Chunk does not match its hash")
+                            except Exception as e:
+                                with cond:
+                                    release_chunk(index)
+                                if sock is not None:
+                                    sock.close()
+                                    sock = None
+                                if index in done:
+                                    # Another source finished this chunk and cut our
+                                    # connection short; that is not this source's fault
+                                    continue
+                                failures += 1
+                                self.log(f"Chunk at {offset} from {source[0]}:{source[1]} failed: {str(e)}")
+                                if failures >= SWARM_MAX_FAILURES:
+                                    self.log(f"Dropping source {source[0]}:{source[1]}")
+                                    return
+                                continue
+                            
+                            failures = 0
+                            if data is None:
+                                # Another source won the race; the rest of this range
+                                # is still on its way, so start a fresh connection
+                                sock.close()
+                                sock = None
+                            else:
+                                # Racing sources write identical bytes, so no lock is needed here
+                                f.seek(offset)
+                                f.write(data)
+                            
+                            with cond:
+                                if data is not None and index not in done:
+                                    done.add(index)
+                                    source_bytes[source] += length
+                                    received[0] += length
+                                    progress = (received[0] / filesize) * 100
+                                    self.root.after(0, self.update_progress, progress, received[0], filesize)
+                                    
+                                    # Unblock sources still fetching this chunk, so a
+                                    # stalled mirror doesn't hold up the finish
+                                    for other in fetching.get(index, ()):
+                                        if other is not sock:
+                                            try:
+                                                socket.socket.shutdown(other, socket.SHUT_RDWR)
+                                            except OSError:
+                                                pass
+                                release_chunk(index)
+                finally:
+                    if sock is not None:
+                        self.close_mirror(sock)
+            
+            # Over TLS each stream encrypts and decrypts on its own threads at both
+            # ends, with the GIL released, instead of one thread doing all the crypto
+            streams = TLS_STREAMS if self.ssl_context else 1
+            workers = [threading.Thread(target=worker, args=(source, mirrors.pop(source, None)), daemon=True)
+                       for source in sources]
+            workers += [threading.Thread(target=worker, args=(source, None), daemon=True)
+                        for source in sources for _ in range(streams - 1)]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            
+            elapsed = max(time.time() - start_time, 1e-6)
+            for source, count in source_bytes.items():
+                self.log(f"  {source[0]}:{source[1]} sent {self.format_size(count)}")
+            
+            if len(done) < len(chunks):
+                self.log(f"Warning: Incomplete download. Received {received[0]} of {filesize} bytes")
+                self.root.after(0, self.update_status, "Download incomplete")
+                return
+            
+            self.log(f"File received successfully: {output_path} ({self.format_size(filesize / elapsed)}/s)")
+            self.root.after(0, self.update_progress, 100.0, filesize, filesize)
+            self.root.after(0, self.update_status, f"Downloaded: {filename}")
+            
+        except Exception as e:
+            self.log(f"Error downloading file: {str(e)}")
+            self.root.after(0, self.update_status, f"Download error: {str(e)}")
+        finally:
+            for sock in mirrors.values():
+                self.close_mirror(sock)
+    
     def update_progress(self, percentage, received, total):
         """Update progress bar and label"""
         self.progress_var.set(percentage)
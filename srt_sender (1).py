@@ -4,10 +4,17 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 import threading
 import time
+import hashlib
+import queue
+import ssl
 
 # Default configuration
 SEPARATOR = "<SEPARATOR>"
 BUFFER_SIZE = 4096
+TRANSFER_BUFFER_SIZE = 256 * 1024  # Large writes let TLS fill whole 16 KB records
+READ_AHEAD_BLOCKS = 8  # File blocks read ahead of the socket
+HASH_CHUNK_SIZE = 1024 * 1024  # Size of the chunks hashed for mirror downloads
+MIRROR_MARKER = f"{SEPARATOR}MIRROR{SEPARATOR}"  # Ends the file list in mirror mode
 HOST = "0.0.0.0"  # Listen on all interfaces
 PORT = 5001
 
@@ -22,6 +29,10 @@ class FileSenderApp:
         self.server_running = False
         self.server_socket = None
         self.server_thread = None
+        self.ssl_context = None
+        self.hash_cache = {}  # (path, size, mtime) -> (file hash, chunk digests)
+        self.hashing = set()  # Cache keys being hashed in the background
+        self.hash_lock = threading.Lock()
         
         # Create main container
         main_frame = tk.Frame(root, bg="#f0f0f0")
@@ -52,6 +63,23 @@ class FileSenderApp:
         browse_btn = tk.Button(settings_frame, text="Browse", command=self.browse_directory)
         browse_btn.grid(row=1, column=4, padx=5, pady=5)
         
+        # TLS certificate and key (leave empty to serve in plaintext)
+        tk.Label(settings_frame, text="TLS Certificate:", bg="#f0f0f0").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        self.cert_var = tk.StringVar(value="")
+        self.cert_entry = tk.Entry(settings_frame, textvariable=self.cert_var, width=40)
+        self.cert_entry.grid(row=2, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W+tk.E)
+        
+        cert_btn = tk.Button(settings_frame, text="Browse", command=lambda: self.browse_file(self.cert_var))
+        cert_btn.grid(row=2, column=4, padx=5, pady=5)
+        
+        tk.Label(settings_frame, text="TLS Key:", bg="#f0f0f0").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
+        self.key_var = tk.StringVar(value="")
+        self.key_entry = tk.Entry(settings_frame, textvariable=self.key_var, width=40)
+        self.key_entry.grid(row=3, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W+tk.E)
+        
+        key_btn = tk.Button(settings_frame, text="Browse", command=lambda: self.browse_file(self.key_var))
+        key_btn.grid(row=3, column=4, padx=5, pady=5)
+        
         # Server control
         self.server_btn = tk.Button(settings_frame, text="Start Server", command=self.toggle_server,
                                    bg="#4CAF50", fg="white", width=15, height=2)
@@ -111,6 +139,12 @@ class FileSenderApp:
             self.directory_var.set(directory)
             self.refresh_files()
     
+    def browse_file(self, var):
+        """Browse for a certificate or key file"""
+        filename = filedialog.askopenfilename(filetypes=[("PEM files", "*.pem *.crt *.key"), ("All files", "*.*")])
+        if filename:
+            var.set(filename)
+    
     def refresh_files(self):
         """Refresh the files list"""
         directory = self.directory_var.get()
@@ -138,6 +172,54 @@ class FileSenderApp:
             size /= 1024.0
         return f"{size:.2f} PB"
     
+    def hash_key(self, filepath):
+        """Cache key that changes whenever the file does"""
+        stat = os.stat(filepath)
+        return (os.path.abspath(filepath), stat.st_size, stat.st_mtime)
+    
+    def file_hashes(self, filepath):
+        """Return (file hash, chunk digests) for a file, or None while it is being hashed.
+        
+        Files are hashed on first request, in the background so large files
+        never hold up a request.
+        """
+        key = self.hash_key(filepath)
+        with self.hash_lock:
+            if key in self.hash_cache:
+                return self.hash_cache[key]
+            if key in self.hashing:
+                return None
+            self.hashing.add(key)
+        
+        threading.Thread(target=self.hash_file, args=(filepath, key), daemon=True).start()
+        return None
+    
+    def hash_file(self, filepath, key):
+        """Hash a file in HASH_CHUNK_SIZE chunks.
+        
+        The file hash is the SHA-256 of the concatenated chunk digests, so a
+        receiver can check the chunk list against it and then each chunk.
+        Gives up if the server is stopped.
+        """
+        try:
+            digests = bytearray()
+            with open(filepath, "rb") as f:
+                for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    if not self.server_running:
+                        return
+                    digests += hashlib.sha256(block).digest()
+            
+            with self.hash_lock:
+                # Forget hashes of earlier versions of the same file
+                for old_key in [k for k in self.hash_cache if k[0] == key[0]]:
+                    del self.hash_cache[old_key]
+                self.hash_cache[key] = (hashlib.sha256(digests).hexdigest(), bytes(digests))
+        except Exception as e:
+            self.log(f"Error hashing {filepath}: {str(e)}")
+        finally:
+            with self.hash_lock:
+                self.hashing.discard(key)
+    
     def toggle_server(self):
         """Start or stop the server"""
         if self.server_running:
@@ -155,6 +237,16 @@ class FileSenderApp:
             if not os.path.isdir(directory):
                 self.log(f"Error: '{directory}' is not a valid directory!")
                 return
+            
+            # Set up TLS if a certificate was given
+            cert = self.cert_var.get().strip()
+            if cert:
+                self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+                self.ssl_context.load_cert_chain(cert, self.key_var.get().strip() or None)
+                self.log("TLS enabled")
+            else:
+                self.ssl_context = None
                 
             # Start server in a separate thread
             self.server_thread = threading.Thread(target=self.run_server, 
@@ -166,6 +258,8 @@ class FileSenderApp:
             self.host_entry.config(state=tk.DISABLED)
             self.port_entry.config(state=tk.DISABLED)
             self.directory_entry.config(state=tk.DISABLED)
+            self.cert_entry.config(state=tk.DISABLED)
+            self.key_entry.config(state=tk.DISABLED)
             
             self.server_running = True
             self.update_status(f"Server running on {host}:{port}")
@@ -190,6 +284,8 @@ class FileSenderApp:
         self.host_entry.config(state=tk.NORMAL)
         self.port_entry.config(state=tk.NORMAL)
         self.directory_entry.config(state=tk.NORMAL)
+        self.cert_entry.config(state=tk.NORMAL)
+        self.key_entry.config(state=tk.NORMAL)
         
         self.log("Server stopped")
         self.update_status("Server stopped")
@@ -239,10 +335,18 @@ class FileSenderApp:
             client_addr = f"{address[0]}:{address[1]}"
             self.log(f"Client connected: {client_addr}")
             
+            if self.ssl_context:
+                # Session tickets and the file list go out as separate small
+                # writes, which Nagle would otherwise hold back
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                
+                # Handshake here rather than in the accept loop
+                client_socket = self.ssl_context.wrap_socket(client_socket, server_side=True)
+            
             # Send available files to the client
             files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
             files_str = ";".join(files)
-            client_socket.send(f"{len(files)}{SEPARATOR}{files_str}".encode())
+            client_socket.sendall(f"{len(files)}{SEPARATOR}{files_str}".encode())
             
             # Wait for file request
             received = client_socket.recv(BUFFER_SIZE).decode()
@@ -266,24 +370,7 @@ class FileSenderApp:
                         # Send the file
                         self.log(f"Sending file: {filename} to {client_addr}")
                         
-                        sent_bytes = 0
-                        with open(filepath, "rb") as f:
-                            while True:
-                                # Read bytes from the file
-                                bytes_read = f.read(BUFFER_SIZE)
-                                
-                                if not bytes_read:
-                                    # File transmission is done
-                                    break
-                                    
-                                # Send data
-                                client_socket.sendall(bytes_read)
-                                sent_bytes += len(bytes_read)
-                                
-                                # Update status occasionally
-                                if sent_bytes % (BUFFER_SIZE * 10) == 0:
-                                    progress = (sent_bytes / filesize) * 100
-                                    self.update_status(f"Sending {filename}: {progress:.1f}%")
+                        self.send_file_data(client_socket, filepath, 0, filesize, filename)
                         
                         self.log(f"File {filename} sent successfully to {client_addr}")
                     else:
@@ -293,6 +380,13 @@ class FileSenderApp:
                     client_socket.send(f"ERROR{SEPARATOR}File not found".encode())
                     self.log(f"File {filename} not found")
             
+            elif received == "MIRROR":
+                # Persistent connection for multi-source downloads. The marker
+                # tells the client where the file list ends.
+                client_socket.sendall(MIRROR_MARKER.encode())
+                self.log(f"Serving {client_addr} as a mirror")
+                self.handle_mirror(client_socket, directory)
+            
             elif received == "DISCONNECT":
                 self.log(f"Client {client_addr} disconnected")
             
@@ -306,6 +400,116 @@ class FileSenderApp:
             # Close client socket
             client_socket.close()
             self.update_status("Server ready")  
+    
+    def handle_mirror(self, client_socket, directory):
+        """Answer INFO, CHUNKS and RANGE requests until the client disconnects"""
+        while True:
+            received = client_socket.recv(BUFFER_SIZE).decode()
+            if not received or received == "DISCONNECT":
+                return
+            
+            parts = received.split(SEPARATOR)
+            filepath = os.path.join(directory, parts[1]) if len(parts) > 1 else None
+            
+            if not filepath or not os.path.isfile(filepath):
+                client_socket.send(f"ERROR{SEPARATOR}File not found".encode())
+                continue
+            
+            if parts[0] == "INFO":
+                # Size and hash so a receiver can check mirrors serve the same file
+                hashes = self.file_hashes(filepath)
+                if hashes is None:
+                    client_socket.send(f"PENDING{SEPARATOR}Hashing file".encode())
+                else:
+                    filesize = os.path.getsize(filepath)
+                    client_socket.send(f"{parts[1]}{SEPARATOR}{filesize}{SEPARATOR}{hashes[0]}{SEPARATOR}{HASH_CHUNK_SIZE}".encode())
+            
+            elif parts[0] == "CHUNKS":
+                # Digests of every chunk, so bad data is caught chunk by chunk
+                hashes = self.file_hashes(filepath)
+                if hashes is None:
+                    client_socket.send(f"PENDING{SEPARATOR}Hashing file".encode())
+                    continue
+                
+                client_socket.send(f"{parts[1]}{SEPARATOR}{len(hashes[1])}".encode())
+                if client_socket.recv(BUFFER_SIZE).decode() != "READY":
+                    return
+                client_socket.sendall(hashes[1])
+            
+            elif parts[0] == "RANGE":
+                # Send part of a file
+                offset = int(parts[2])
+                filesize = os.path.getsize(filepath)
+                length = max(0, min(int(parts[3]), filesize - offset))
+                
+                client_socket.send(f"{parts[1]}{SEPARATOR}{length}".encode())
+                if client_socket.recv(BUFFER_SIZE).decode() != "READY":
+                    return
+                self.send_file_data(client_socket, filepath, offset, length)
+            
+            else:
+                client_socket.send(f"ERROR{SEPARATOR}Unknown request".encode())
+    
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        """Send part of a file while a helper thread reads ahead from disk.
+        
+        Reading overlaps with encryption and sending, which both release the GIL.
+        Progress is shown in the status bar when a filename is given.
+        """
+        blocks = queue.Queue(maxsize=READ_AHEAD_BLOCKS)
+        stop = threading.Event()
+        read_error = []
+        
+        def put(block):
+            # Give up if the sending side has stopped taking blocks
+            while not stop.is_set():
+                try:
+                    blocks.put(block, timeout=1.0)
+                    return
+                except queue.Full:
+                    continue
+        
+        def reader():
+            try:
+                with open(filepath, "rb") as f:
+                    f.seek(offset)
+                    remaining = length
+                    while remaining > 0 and not stop.is_set():
+                        bytes_read = f.read(min(TRANSFER_BUFFER_SIZE, remaining))
+                        
+                        if not bytes_read:
+                            # File shrank while sending
+                            break
+                        
+                        put(bytes_read)
+                        remaining -= len(bytes_read)
+            except Exception as e:
+                read_error.append(e)
+            finally:
+                put(None)
+        
+        threading.Thread(target=reader, daemon=True).start()
+        
+        sent_bytes = 0
+        try:
+            while True:
+                bytes_read = blocks.get()
+                if bytes_read is None:
+                    break
+                
+                client_socket.sendall(bytes_read)
+                sent_bytes += len(bytes_read)
+                
+                # Update status occasionally
+                if filename and sent_bytes % (TRANSFER_BUFFER_SIZE * 4) == 0:
+                    progress = (sent_bytes / length) * 100
+                    self.update_status(f"Sending {filename}: {progress:.1f}%")
+        finally:
+            stop.set()
+        
+        if read_error:
+            raise read_error[0]
+        return sent_bytes
 
 if __name__ == "__main__":
     root = tk.Tk()
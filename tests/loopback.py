@@ -0,0 +1,152 @@
+"""Run the sender and receiver apps headless on loopback.
+
+The apps are built with object.__new__ so no Tk window is needed; only the
+state their network code touches is filled in.
+"""
+import importlib.util
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_module(name, filename):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+sender = load_module("srt_sender", "srt_sender (1).py")
+receiver = load_module("srt_receiver", "srt_receiver.py")
+
+
+class Var:
+    """Stand-in for a Tk variable"""
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class Root:
+    """Stand-in for the Tk root that runs callbacks straight away"""
+
+    def after(self, ms, func, *args):
+        func(*args)
+
+
+class Sender(sender.FileSenderApp):
+    """Headless sender that records the ranges it serves"""
+
+    def __init__(self, ssl_context=None):
+        self.server_running = True
+        self.ssl_context = ssl_context
+        self.hash_cache = {}
+        self.hashing = set()
+        self.hash_lock = threading.Lock()
+        self.logs = []
+        self.ranges_sent = 0
+
+    def log(self, message):
+        self.logs.append(message)
+
+    def update_status(self, message):
+        pass
+
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        self.ranges_sent += 1
+        return super().send_file_data(client_socket, filepath, offset, length, filename)
+
+
+def start_sender(directory, app=None):
+    """Serve a directory on an ephemeral loopback port.
+
+    Returns (app, port, stop), where stop() closes the listening socket.
+    """
+    app = app or Sender()
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.bind(("127.0.0.1", 0))
+    server_socket.listen(16)
+    port = server_socket.getsockname()[1]
+
+    def accept_loop():
+        while True:
+            try:
+                client_socket, address = server_socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=app.handle_client, args=(client_socket, address, directory),
+                             daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return app, port, server_socket.close
+
+
+def make_certificates(directory):
+    """Create a throwaway CA and a server certificate for 127.0.0.1 with openssl.
+
+    Returns (ca_path, cert_path, key_path), or None if openssl is not installed.
+    """
+    if not shutil.which("openssl"):
+        return None
+
+    def path(name):
+        return os.path.join(str(directory), name)
+
+    def openssl(*args):
+        subprocess.run(["openssl", *args], check=True, capture_output=True)
+
+    openssl("req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=Loopback Test CA", "-keyout", path("ca.key"), "-out", path("ca.pem"),
+            "-addext", "basicConstraints=critical,CA:TRUE",
+            "-addext", "keyUsage=critical,keyCertSign,cRLSign")
+    openssl("req", "-newkey", "rsa:2048", "-nodes", "-subj", "/CN=127.0.0.1",
+            "-keyout", path("server.key"), "-out", path("server.csr"))
+    with open(path("server.ext"), "w") as f:
+        f.write("subjectAltName=IP:127.0.0.1\n"
+                "basicConstraints=CA:FALSE\n"
+                "keyUsage=critical,digitalSignature,keyEncipherment\n"
+                "extendedKeyUsage=serverAuth\n"
+                "authorityKeyIdentifier=keyid\n")
+    openssl("x509", "-req", "-days", "1", "-in", path("server.csr"), "-CA", path("ca.pem"),
+            "-CAkey", path("ca.key"), "-CAcreateserial", "-extfile", path("server.ext"),
+            "-out", path("server.pem"))
+    return path("ca.pem"), path("server.pem"), path("server.key")
+
+
+def tls_contexts(ca_path, cert_path, key_path):
+    """Server and client contexts set up the way the apps build them"""
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.minimum_version = ssl.TLSVersion.TLSv1_2
+    server_context.load_cert_chain(cert_path, key_path)
+    client_context = ssl.create_default_context(cafile=ca_path)
+    return server_context, client_context
+
+
+def make_receiver(output_dir, sources, ssl_context=None):
+    """Headless receiver; its log lines are collected in app.logs"""
+    app = object.__new__(receiver.FileReceiverApp)
+    app.logs = []
+    app.log = app.logs.append
+    app.update_status = lambda message: None
+    app.update_progress = lambda percentage, received, total: None
+    app.root = Root()
+    app.progress_var = Var(0)
+    app.output_dir_var = Var(str(output_dir))
+    app.connected = False
+    app.socket = None
+    app.available_files = []
+    app.sources = sources
+    app.ssl_context = ssl_context
+    app.tls_sessions = {}
+    return app
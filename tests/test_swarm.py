@@ -0,0 +1,254 @@
+import os
+import time
+
+import pytest
+
+from loopback import Sender, make_receiver, receiver, sender, start_sender
+
+FILENAME = "payload.bin"
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Many chunks from a small file, so every mirror gets a share of the work
+    monkeypatch.setattr(sender, "HASH_CHUNK_SIZE", CHUNK_SIZE)
+
+
+@pytest.fixture
+def payload():
+    return os.urandom(40 * CHUNK_SIZE + 1234)
+
+
+@pytest.fixture
+def servers():
+    stops = []
+
+    def serve(directory, app=None):
+        app, port, stop = start_sender(directory, app)
+        stops.append(stop)
+        return app, ("127.0.0.1", port)
+
+    yield serve
+    for stop in stops:
+        stop()
+
+
+def make_share(path, data):
+    path.mkdir()
+    (path / FILENAME).write_bytes(data)
+    return path
+
+
+class FlakySender(Sender):
+    """Mirror that dies part way through its third range and every one after"""
+
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        self.ranges_sent += 1
+        if self.ranges_sent > 2:
+            client_socket.sendall(b"\0" * (length // 2))
+            raise ConnectionError("mirror went down")
+        return sender.FileSenderApp.send_file_data(self, client_socket, filepath, offset, length, filename)
+
+
+class CorruptSender(Sender):
+    """Mirror that reports the right hashes but serves damaged chunks"""
+
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        self.ranges_sent += 1
+        with open(filepath, "rb") as f:
+            f.seek(offset)
+            data = bytearray(f.read(length))
+        data[0] ^= 0xFF
+        client_socket.sendall(data)
+        return length
+
+
+class SlowSender(Sender):
+    """Mirror that takes a while over every range"""
+
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        time.sleep(0.2)
+        return super().send_file_data(client_socket, filepath, offset, length, filename)
+
+
+class StalledSender(Sender):
+    """Mirror that starts a range and then goes quiet for longer than the test"""
+
+    def send_file_data(self, client_socket, filepath, offset, length, filename=None):
+        self.ranges_sent += 1
+        client_socket.sendall(b"\0" * 100)
+        time.sleep(30)
+
+
+class SlowHashSender(Sender):
+    """Mirror that takes a while to hash, so INFO answers PENDING at first"""
+
+    def hash_file(self, filepath, key):
+        time.sleep(1.0)
+        super().hash_file(filepath, key)
+
+
+def download(tmp_path, sources):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    app = make_receiver(output_dir, sources)
+    app.swarm_download_thread(FILENAME)
+    return app, (output_dir / FILENAME)
+
+
+def test_swarm_uses_every_mirror(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    apps, sources = zip(*[servers(share) for _ in range(3)])
+
+    app, output = download(tmp_path, list(sources))
+
+    assert output.read_bytes() == payload
+    assert all(mirror.ranges_sent > 0 for mirror in apps)
+    assert any(line.startswith("File received successfully") for line in app.logs)
+
+
+def test_swarm_skips_mismatched_mirror(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    other = make_share(tmp_path / "other", os.urandom(len(payload)))
+    _, first = servers(share)
+    odd_app, odd = servers(other)
+    _, second = servers(share)
+
+    app, output = download(tmp_path, [first, odd, second])
+
+    assert output.read_bytes() == payload
+    assert odd_app.ranges_sent == 0
+    assert any("has a different copy" in line for line in app.logs)
+
+
+def test_swarm_survives_mirror_failing_mid_transfer(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    _, first = servers(share)
+    flaky_app, flaky = servers(share, FlakySender())
+    _, second = servers(share)
+
+    app, output = download(tmp_path, [first, flaky, second])
+
+    assert output.read_bytes() == payload
+    assert flaky_app.ranges_sent > 2
+    assert any(line.startswith("Dropping source") for line in app.logs)
+
+
+def test_swarm_requeues_corrupt_chunks(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    corrupt_app, corrupt = servers(share, CorruptSender())
+    _, good = servers(share)
+
+    app, output = download(tmp_path, [corrupt, good])
+
+    assert output.read_bytes() == payload
+    assert corrupt_app.ranges_sent > 0
+    assert any("does not match its hash" in line for line in app.logs)
+
+
+def test_swarm_rebalances_away_from_slow_mirror(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    fast_app, fast = servers(share)
+    slow_app, slow = servers(share, SlowSender())
+
+    start = time.time()
+    app, output = download(tmp_path, [slow, fast])
+
+    assert output.read_bytes() == payload
+    assert time.time() - start < 5
+    assert fast_app.ranges_sent > 3 * slow_app.ranges_sent
+
+
+def test_swarm_does_not_wait_for_stalled_mirror(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    _, fast = servers(share)
+    stalled_app, stalled = servers(share, StalledSender())
+
+    start = time.time()
+    app, output = download(tmp_path, [stalled, fast])
+
+    assert output.read_bytes() == payload
+    # Well under the 10 s socket timeout a stalled recv would otherwise wait for
+    assert time.time() - start < 5
+    assert stalled_app.ranges_sent > 0
+    assert not any("failed" in line for line in app.logs)
+
+
+def test_swarm_prefers_first_source_on_tie(tmp_path, payload, servers, monkeypatch):
+    monkeypatch.setattr(receiver, "HASH_POLL_INTERVAL", 0.1)
+    share = make_share(tmp_path / "share", payload)
+    other = make_share(tmp_path / "other", os.urandom(len(payload)))
+    # The first source answers last, so the pick can't depend on timing
+    _, first = servers(share, SlowHashSender())
+    _, second = servers(other)
+
+    app, output = download(tmp_path, [first, second])
+
+    assert output.read_bytes() == payload
+    assert any(line.startswith(f"Source {second[0]}:{second[1]} has a different copy") for line in app.logs)
+
+
+def test_swarm_survives_unreachable_mirror(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    _, first = servers(share)
+    _, second = servers(share)
+
+    # Nothing listens on port 1
+    app, output = download(tmp_path, [first, ("127.0.0.1", 1), second])
+
+    assert output.read_bytes() == payload
+    assert any("unavailable" in line for line in app.logs)
+
+
+def test_swarm_skips_long_file_list(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    for i in range(300):
+        (share / f"padding-file-with-a-long-name-{i:04}.txt").write_bytes(b"x")
+    sources = [servers(share)[1] for _ in range(2)]
+
+    app, output = download(tmp_path, sources)
+
+    assert output.read_bytes() == payload
+
+
+def test_swarm_waits_for_mirrors_to_finish_hashing(tmp_path, payload, servers, monkeypatch):
+    monkeypatch.setattr(receiver, "HASH_POLL_INTERVAL", 0.1)
+    share = make_share(tmp_path / "share", payload)
+    sources = [servers(share, SlowHashSender())[1] for _ in range(2)]
+
+    app, output = download(tmp_path, sources)
+
+    assert output.read_bytes() == payload
+    assert not any("unavailable" in line for line in app.logs)
+
+
+def test_connect_falls_back_to_next_source(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    _, source = servers(share)
+    app = make_receiver(tmp_path, [])
+    app.update_file_list = lambda count: None
+    app.update_ui_connected = lambda: None
+    app.reset_connection_ui = lambda: app.logs.append("reset")
+
+    app.connect_thread([("127.0.0.1", 1), source])
+
+    assert app.connected
+    assert app.available_files == [FILENAME]
+    assert "reset" not in app.logs
+    app.socket.close()
+
+
+def test_sender_keeps_only_latest_hashes(tmp_path, payload, servers):
+    share = make_share(tmp_path / "share", payload)
+    apps, sources = zip(*[servers(share) for _ in range(2)])
+    download(tmp_path, list(sources))
+
+    changed = os.urandom(len(payload) + 1)
+    (share / FILENAME).write_bytes(changed)
+    (tmp_path / "out" / FILENAME).unlink()
+    (tmp_path / "out").rmdir()
+    app, output = download(tmp_path, list(sources))
+
+    assert output.read_bytes() == changed
+    assert all(len(mirror.hash_cache) == 1 for mirror in apps)
@@ -0,0 +1,131 @@
+import os
+import ssl
+import time
+
+import pytest
+
+from loopback import Sender, make_certificates, make_receiver, receiver, sender, start_sender, tls_contexts
+
+FILENAME = "payload.bin"
+
+
+@pytest.fixture(scope="module")
+def contexts(tmp_path_factory):
+    paths = make_certificates(tmp_path_factory.mktemp("ca"))
+    if paths is None:
+        pytest.skip("openssl is not installed")
+    return tls_contexts(*paths)
+
+
+@pytest.fixture
+def payload():
+    return os.urandom(3 * 1024 * 1024 + 4321)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Smaller chunks so every stream gets several
+    monkeypatch.setattr(sender, "HASH_CHUNK_SIZE", 64 * 1024)
+
+
+@pytest.fixture
+def tls_server(tmp_path, payload, contexts):
+    share = tmp_path / "share"
+    share.mkdir()
+    (share / FILENAME).write_bytes(payload)
+    app, port, stop = start_sender(share, Sender(ssl_context=contexts[0]))
+    yield app, ("127.0.0.1", port)
+    stop()
+
+
+def test_encrypted_download_is_byte_exact(tmp_path, payload, contexts, tls_server):
+    app, source = tls_server
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    client = make_receiver(output_dir, [source], contexts[1])
+
+    client.swarm_download_thread(FILENAME)
+
+    assert (output_dir / FILENAME).read_bytes() == payload
+    assert app.ranges_sent > 0
+
+
+def test_encrypted_download_uses_parallel_streams(tmp_path, payload, contexts, small_chunks, tls_server,
+                                                  monkeypatch):
+    monkeypatch.setattr(receiver, "TLS_STREAMS", 3)
+    app, source = tls_server
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    client = make_receiver(output_dir, [source], contexts[1])
+
+    client.swarm_download_thread(FILENAME)
+
+    assert (output_dir / FILENAME).read_bytes() == payload
+    assert sum(line.endswith("as a mirror") for line in app.logs) >= 3
+
+
+def test_single_stream_tls_skips_the_swarm(tmp_path, payload, contexts, tls_server, monkeypatch):
+    monkeypatch.setattr(receiver, "TLS_STREAMS", 1)
+    app, source = tls_server
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    client = make_receiver(output_dir, [source], contexts[1])
+    client.update_file_list = lambda count: None
+    client.update_ui_connected = lambda: None
+    client.connect_thread([source])
+    client.files_listbox = type("Listbox", (), {"curselection": lambda self: (0,)})()
+
+    client.download_file()
+    deadline = time.time() + 10
+    while not any(line.startswith("File received successfully") for line in client.logs):
+        assert time.time() < deadline
+        time.sleep(0.05)
+
+    assert (output_dir / FILENAME).read_bytes() == payload
+    assert not any(line.endswith("as a mirror") for line in app.logs)
+    client.socket.close()
+
+
+def test_reconnect_resumes_session(tmp_path, contexts, tls_server):
+    _, source = tls_server
+    client = make_receiver(tmp_path, [source], contexts[1])
+
+    first = client.open_mirror(source)
+    second = client.open_mirror(source)
+
+    assert isinstance(first, ssl.SSLSocket)
+    assert not first.session_reused
+    assert second.session_reused
+    client.close_mirror(first)
+    client.close_mirror(second)
+
+
+def test_untrusted_server_is_rejected(tmp_path, tls_server):
+    _, source = tls_server
+    client = make_receiver(tmp_path, [source], ssl.create_default_context())
+
+    with pytest.raises(ssl.SSLCertVerificationError):
+        client.open_mirror(source)
+
+
+def test_plaintext_client_gets_nothing(tmp_path, tls_server):
+    _, source = tls_server
+    client = make_receiver(tmp_path, [source])
+
+    client.swarm_download_thread(FILENAME)
+
+    assert any("No source can provide the file" in line for line in client.logs)
+    assert not (tmp_path / FILENAME).exists()
+
+
+def test_connect_reports_encryption(tmp_path, contexts, tls_server):
+    _, source = tls_server
+    client = make_receiver(tmp_path, [source], contexts[1])
+    client.update_file_list = lambda count: None
+    client.update_ui_connected = lambda: None
+
+    client.connect_thread([source])
+
+    assert client.connected
+    assert any(line.startswith("Encrypted with TLS") for line in client.logs)
+    client.socket.close()